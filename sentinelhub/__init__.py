@@ -26,6 +26,7 @@ from .api import (
     WmsRequest,
     monitor_batch_analysis,
     monitor_batch_job,
+    monitor_batch_job_async,
     monitor_batch_statistical_analysis,
     monitor_batch_statistical_job,
     opensearch,
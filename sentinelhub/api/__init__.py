@@ -12,6 +12,7 @@ from .batch import (
     SentinelHubBatchStatistical,
     monitor_batch_analysis,
     monitor_batch_job,
+    monitor_batch_job_async,
     monitor_batch_statistical_analysis,
     monitor_batch_statistical_job,
 )
@@ -54,16 +54,19 @@ class SentinelHubFeatureIterator(FeatureIterator[JsonDict]):
         """
         :param args: Arguments passed to FeatureIterator
         :param exception_message: A message to be raised if no features are found
-        :param kwargs: Keyword arguments passed to FeatureIterator
+        :param kwargs: Keyword arguments passed to FeatureIterator. Parameters without a value are removed from
+            `params` before any request is made.
         """
         self.exception_message = exception_message or "No data found"
         self.next: Optional[JsonDict] = None
 
         super().__init__(*args, **kwargs)
 
+        self.params = remove_undefined(self.params)
+
     def _fetch_features(self) -> Iterable[JsonDict]:
         """Collect more results from the service"""
-        params = remove_undefined({**self.params, "viewtoken": self.next})
+        params = self.params if self.next is None else {**self.params, "viewtoken": self.next}
         url = f"{self.url}?{urlencode(params)}"
 
         json_response = self.client.get_json_dict(url, use_session=True)
@@ -7,6 +7,7 @@ from .statistical import BatchStatisticalRequest, SentinelHubBatchStatistical
 from .utils import (
     monitor_batch_analysis,
     monitor_batch_job,
+    monitor_batch_job_async,
     monitor_batch_statistical_analysis,
     monitor_batch_statistical_job,
 )
@@ -84,8 +84,8 @@ class BaseBatchRequest(metaclass=ABCMeta):
 
     def __repr__(self) -> str:
         """A representation that shows the basic parameters of a batch job"""
-        repr_params = {name: getattr(self, name) for name in self._REPR_PARAM_NAMES if getattr(self, name) is not None}
-        repr_params_str = "\n  ".join(f"{name}={value}" for name, value in repr_params.items())
+        repr_params = ((name, getattr(self, name)) for name in self._REPR_PARAM_NAMES)
+        repr_params_str = "\n  ".join(f"{name}={value}" for name, value in repr_params if value is not None)
         return f"{self.__class__.__name__}(\n  {repr_params_str}\n  ...\n)"
 
     def raise_for_status(
@@ -7,6 +7,7 @@ import logging
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 
 from dataclasses_json import CatchAll, LetterCase, Undefined
 from dataclasses_json import config as dataclass_config
@@ -171,7 +172,7 @@ class SentinelHubBatch(BaseBatchClient):
         return SentinelHubFeatureIterator(
             client=self.client,
             url=self._get_tiling_grids_url(),
-            params=remove_undefined(kwargs),
+            params=kwargs,
             exception_message="Failed to obtain information about available tiling grids",
         )
 
@@ -201,7 +202,7 @@ class SentinelHubBatch(BaseBatchClient):
         :param kwargs: Any additional parameters to include in a request query
         :return: An iterator over existing batch requests
         """
-        params = remove_undefined({"userid": user_id, "search": search, "sort": sort, **kwargs})
+        params = {"userid": user_id, "search": search, "sort": sort, **kwargs}
         feature_iterator = SentinelHubFeatureIterator(
             client=self.client, url=self._get_processing_url(), params=params, exception_message="No requests found"
         )
@@ -213,11 +214,12 @@ class SentinelHubBatch(BaseBatchClient):
 
         :return: Batch request info
         """
-        latest_request_iter = self.iter_requests(sort="created:desc", count=1)
-        try:
-            return next(latest_request_iter)
-        except StopIteration as exception:
-            raise ValueError("No batch request is available") from exception
+        params = {"sort": "created:desc", "count": 1}
+        url = f"{self._get_processing_url()}?{urlencode(params)}"
+        latest_requests = self.client.get_json_dict(url, use_session=True).get("data")
+        if not latest_requests:
+            raise ValueError("No batch request is available")
+        return BatchRequest.from_dict(latest_requests[0])
 
     def get_request(self, batch_request: BatchRequestType) -> "BatchRequest":
         """Collects information about a single batch request
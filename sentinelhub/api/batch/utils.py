@@ -2,9 +2,11 @@
 Module implementing utilities for working with batch jobs.
 """
 import logging
+import threading
 import time
 from collections import defaultdict
-from typing import DefaultDict, List, Optional, Union
+from concurrent.futures import Future
+from typing import DefaultDict, Iterable, List, Optional, Union
 
 from tqdm.auto import tqdm
 
@@ -22,10 +24,14 @@ BatchStatisticalRequestSpec = Union[str, dict, BatchStatisticalRequest]
 
 _MIN_SLEEP_TIME = 60
 _DEFAULT_SLEEP_TIME = 120
+_DEFAULT_MAX_SLEEP_TIME = 600
+_SLEEP_BACKOFF_FACTOR = 1.5
+_EXPECTED_REMAINING_UPDATES = 20
 _MIN_STAT_SLEEP_TIME = 15
 _DEFAULT_STAT_SLEEP_TIME = 30
 _MIN_ANALYSIS_SLEEP_TIME = 5
 _DEFAULT_ANALYSIS_SLEEP_TIME = 10
+_FINISHED_TILE_STATUSES = (BatchTileStatus.PROCESSED, BatchTileStatus.FAILED)
 
 
 def monitor_batch_job(
@@ -33,6 +39,7 @@ def monitor_batch_job(
     config: Optional[SHConfig] = None,
     sleep_time: int = _DEFAULT_SLEEP_TIME,
     analysis_sleep_time: int = _DEFAULT_ANALYSIS_SLEEP_TIME,
+    max_sleep_time: Optional[int] = None,
 ) -> DefaultDict[BatchTileStatus, List[dict]]:
     """A utility function that keeps checking for number of processed tiles until the given batch request finishes.
     During the process it shows a progress bar and at the end it reports information about finished and failed tiles.
@@ -44,6 +51,8 @@ def monitor_batch_job(
       - This function will be continuously collecting tile information from Sentinel Hub service. To avoid making too
         many requests please make sure to adjust `sleep_time` parameter according to the size of your job. Larger jobs
         don't need very frequent tile status updates.
+      - Sleeping time between updates adapts to the progress of a job. If no new tiles finish it gradually increases
+        up to `max_sleep_time`, otherwise it is set according to the estimated time until the job finishes.
       - Some information about the progress of this function is reported to logging level INFO.
 
     :param batch_request: An object with information about a batch request. Alternatively, it could only be a batch
@@ -51,12 +60,18 @@ def monitor_batch_job(
     :param config: A configuration object with required parameters `sh_client_id`, `sh_client_secret`, and
         `sh_auth_base_url` which is used for authentication and `sh_base_url` which defines the service deployment
         where Batch API will be called.
-    :param sleep_time: Number of seconds to sleep between consecutive progress bar updates.
+    :param sleep_time: Minimal number of seconds to sleep between consecutive progress bar updates.
     :param analysis_sleep_time: Number of seconds between consecutive status updates during analysis phase.
+    :param max_sleep_time: Maximal number of seconds to sleep between consecutive progress bar updates. By default,
+        it is the larger of `sleep_time` and 600 seconds.
     :return: A dictionary mapping a tile status to a list of tile payloads.
     """
     if sleep_time < _MIN_SLEEP_TIME:
         raise ValueError(f"To avoid making too many service requests please set sleep_time>={_MIN_SLEEP_TIME}")
+    if max_sleep_time is None:
+        max_sleep_time = max(sleep_time, _DEFAULT_MAX_SLEEP_TIME)
+    elif max_sleep_time < sleep_time:
+        raise ValueError("Parameter max_sleep_time should not be smaller than sleep_time")
 
     batch_request = monitor_batch_analysis(batch_request, config=config, sleep_time=analysis_sleep_time)
     if batch_request.status is BatchRequestStatus.PROCESSING:
@@ -64,48 +79,125 @@ def monitor_batch_job(
 
     batch_client = SentinelHubBatch(config=config)
 
-    tiles_per_status = _get_batch_tiles_per_status(batch_request, batch_client)
+    tiles_per_status = _get_batch_tiles_per_status(batch_request, batch_client, _FINISHED_TILE_STATUSES)
     success_count = len(tiles_per_status[BatchTileStatus.PROCESSED])
     finished_count = success_count + len(tiles_per_status[BatchTileStatus.FAILED])
 
     progress_bar = tqdm(total=batch_request.tile_count, initial=finished_count, desc="Progress rate")
     success_bar = tqdm(total=finished_count, initial=success_count, desc="Success rate")
+    current_sleep_time: float = sleep_time
     with progress_bar, success_bar:
         while finished_count < batch_request.tile_count:
-            time.sleep(sleep_time)
+            time.sleep(current_sleep_time)
 
-            tiles_per_status = _get_batch_tiles_per_status(batch_request, batch_client)
+            tiles_per_status = _get_batch_tiles_per_status(batch_request, batch_client, _FINISHED_TILE_STATUSES)
             new_success_count = len(tiles_per_status[BatchTileStatus.PROCESSED])
             new_finished_count = new_success_count + len(tiles_per_status[BatchTileStatus.FAILED])
 
             progress_bar.update(new_finished_count - finished_count)
-            if new_finished_count != finished_count:
+            if new_finished_count != finished_count or new_success_count != success_count:
                 success_bar.total = new_finished_count
+                success_bar.n = new_success_count
                 success_bar.refresh()
-            success_bar.update(new_success_count - success_count)
 
+            current_sleep_time = _get_next_sleep_time(
+                current_sleep_time,
+                finished_delta=new_finished_count - finished_count,
+                remaining_count=batch_request.tile_count - new_finished_count,
+                min_sleep_time=sleep_time,
+                max_sleep_time=max_sleep_time,
+            )
             finished_count = new_finished_count
             success_count = new_success_count
 
     failed_tiles_num = finished_count - success_count
     if failed_tiles_num:
         LOGGER.info("Batch job failed for %d tiles", failed_tiles_num)
+
+    unfinished_statuses = [status for status in BatchTileStatus if status not in _FINISHED_TILE_STATUSES]
+    unfinished_tiles_per_status = _get_batch_tiles_per_status(batch_request, batch_client, unfinished_statuses)
+    for status, tiles in unfinished_tiles_per_status.items():
+        tiles_per_status[status].extend(tiles)
     return tiles_per_status
 
 
+def monitor_batch_job_async(
+    batch_request: BatchProcessRequestSpec,
+    config: Optional[SHConfig] = None,
+    sleep_time: int = _DEFAULT_SLEEP_TIME,
+    analysis_sleep_time: int = _DEFAULT_ANALYSIS_SLEEP_TIME,
+    max_sleep_time: Optional[int] = None,
+) -> Future:
+    """Runs `monitor_batch_job` in a background thread so that the calling thread can continue with other work while
+    the job is being monitored.
+
+    The monitoring thread is a daemon thread, therefore it doesn't prevent the Python interpreter from exiting before
+    the batch job finishes.
+
+    :param batch_request: An object with information about a batch request. Alternatively, it could only be a batch
+        request id or a payload.
+    :param config: A configuration object with required parameters `sh_client_id`, `sh_client_secret`, and
+        `sh_auth_base_url` which is used for authentication and `sh_base_url` which defines the service deployment
+        where Batch API will be called.
+    :param sleep_time: Minimal number of seconds to sleep between consecutive progress bar updates.
+    :param analysis_sleep_time: Number of seconds between consecutive status updates during analysis phase.
+    :param max_sleep_time: Maximal number of seconds to sleep between consecutive progress bar updates. By default,
+        it is the larger of `sleep_time` and 600 seconds.
+    :return: A future object which resolves into the result of `monitor_batch_job` or raises its exception.
+    """
+    future: Future = Future()
+
+    def _run_monitoring() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            tiles_per_status = monitor_batch_job(
+                batch_request,
+                config=config,
+                sleep_time=sleep_time,
+                analysis_sleep_time=analysis_sleep_time,
+                max_sleep_time=max_sleep_time,
+            )
+        except Exception as exception:  # pylint: disable=broad-except
+            future.set_exception(exception)
+        else:
+            future.set_result(tiles_per_status)
+
+    threading.Thread(target=_run_monitoring, daemon=True).start()
+    return future
+
+
+def _get_next_sleep_time(
+    sleep_time: float, finished_delta: int, remaining_count: int, min_sleep_time: float, max_sleep_time: float
+) -> float:
+    """A helper function that decides how long to sleep before the next tile status update. If no tiles finished
+    during the last sleep it backs off, otherwise it estimates the remaining time of a job from the observed rate of
+    finishing tiles.
+
+    :return: Number of seconds to sleep, clipped to the interval `[min_sleep_time, max_sleep_time]`.
+    """
+    if finished_delta <= 0:
+        return min(sleep_time * _SLEEP_BACKOFF_FACTOR, max_sleep_time)
+
+    estimated_remaining_time = remaining_count * sleep_time / finished_delta
+    return min(max(estimated_remaining_time / _EXPECTED_REMAINING_UPDATES, min_sleep_time), max_sleep_time)
+
+
 def _get_batch_tiles_per_status(
-    batch_request: BatchRequest, batch_client: SentinelHubBatch
+    batch_request: BatchRequest, batch_client: SentinelHubBatch, statuses: Iterable[BatchTileStatus]
 ) -> DefaultDict[BatchTileStatus, List[dict]]:
-    """A helper function that queries information about batch tiles and returns information about tiles, grouped by
-    tile status.
+    """A helper function that queries information about batch tiles with given statuses and returns information about
+    tiles, grouped by tile status. Tiles are filtered by status on the service side therefore payloads of tiles with
+    other statuses are never downloaded.
 
     :return: A dictionary mapping a tile status to a list of tile payloads.
     """
     tiles_per_status = defaultdict(list)
 
-    for tile in batch_client.iter_tiles(batch_request):
-        status = BatchTileStatus(tile["status"])
-        tiles_per_status[status].append(tile)
+    for requested_status in statuses:
+        for tile in batch_client.iter_tiles(batch_request, status=requested_status):
+            status = BatchTileStatus(tile["status"])
+            tiles_per_status[status].append(tile)
 
     return tiles_per_status
 
@@ -2,13 +2,16 @@
 Module implementing a rate-limited multithreaded download client for downloading from Sentinel Hub service
 """
 import logging
+import os
 import time
 import warnings
+from http.cookiejar import DefaultCookiePolicy
 from threading import Lock
 from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from ..config import SHConfig
 from ..constants import SHConstants
@@ -30,6 +33,8 @@ class SentinelHubDownloadClient(DownloadClient):
 
     _CACHED_SESSIONS: Dict[Tuple[str, str], SentinelHubSession] = {}
     _UNIVERSAL_CACHE_KEY = "universal-user", "default-url"
+    _HTTP_SESSIONS: Dict[int, requests.Session] = {}
+    _HTTP_POOL_SIZE = 32
 
     def __init__(self, *, session: Optional[SentinelHubSession] = None, **kwargs: Any):
         """
@@ -108,7 +113,7 @@ class SentinelHubDownloadClient(DownloadClient):
         if request.url is None:
             raise ValueError(f"Faulty request {request}, no URL specified.")
 
-        return requests.request(
+        return self._get_http_session().request(
             request.request_type.value,
             url=request.url,
             json=request.post_values,
@@ -116,6 +121,26 @@ class SentinelHubDownloadClient(DownloadClient):
             timeout=self.config.download_timeout_seconds,
         )
 
+    @staticmethod
+    def _get_http_session() -> requests.Session:
+        """Provides an HTTP session shared by all client instances within the current process. The session keeps
+        connections to the service alive so that consecutive requests don't have to open a new connection and repeat
+        the TLS handshake. Sessions are not shared between processes because pooled connections can't be reused after
+        a process is forked. Cookies are never stored so that no state is carried over between requests of different
+        clients.
+        """
+        process_id = os.getpid()
+        http_session = SentinelHubDownloadClient._HTTP_SESSIONS.get(process_id)
+        if http_session is None:
+            http_session = requests.Session()
+            http_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(pool_maxsize=SentinelHubDownloadClient._HTTP_POOL_SIZE)
+            http_session.mount("http://", adapter)
+            http_session.mount("https://", adapter)
+            SentinelHubDownloadClient._HTTP_SESSIONS = {process_id: http_session}
+
+        return http_session
+
     def _prepare_headers(self, request: DownloadRequest) -> JsonDict:
         """Prepares final headers by potentially joining them with session headers. Note that in the current
         implementation of this method request headers have priority to overwrite default and session headers with the
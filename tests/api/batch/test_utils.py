@@ -7,13 +7,16 @@ how many interactions with Sentinel Hub service they make, how much time they sl
 Because of that the tests are very strict. If you break them make sure to understand what is happening before either
 changing the code or the tests.
 """
+import io
 import random
 import sys
 from collections import defaultdict
-from typing import Callable, Dict, List, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from unittest.mock import Mock
 
 import pytest
 from pytest_mock import MockerFixture
+from tqdm import tqdm
 
 from sentinelhub import (
     BatchRequest,
@@ -23,9 +26,11 @@ from sentinelhub import (
     SHConfig,
     monitor_batch_analysis,
     monitor_batch_job,
+    monitor_batch_job_async,
     monitor_batch_statistical_analysis,
     monitor_batch_statistical_job,
 )
+from sentinelhub.api.batch.utils import _get_next_sleep_time
 
 
 @pytest.mark.skipif(sys.version < "3.8", reason="Mocking check for call.args doesn't work correctly for Python 3.7")
@@ -39,6 +44,11 @@ from sentinelhub import (
             {BatchTileStatus.PROCESSED: 6},
         ),
         ({BatchTileStatus.PROCESSED: 2, BatchTileStatus.FAILED: 3},),
+        (
+            {BatchTileStatus.PROCESSED: 2, BatchTileStatus.FAILED: 1, BatchTileStatus.PENDING: 1},
+            {BatchTileStatus.PROCESSED: 3, BatchTileStatus.PENDING: 1},
+            {BatchTileStatus.PROCESSED: 4},
+        ),
     ],
 )
 @pytest.mark.parametrize("batch_status", [BatchRequestStatus.PROCESSING, BatchRequestStatus.ANALYSIS_DONE])
@@ -72,16 +82,26 @@ def test_monitor_batch_process_job(
     monitor_analysis_mock = mocker.patch("sentinelhub.api.batch.utils.monitor_batch_analysis")
     monitor_analysis_mock.return_value = batch_request
 
-    batch_tiles_mock = mocker.patch("sentinelhub.SentinelHubBatch.iter_tiles")
-    batch_tiles_mock.side_effect = tiles_sequence
-
-    sleep_mock = mocker.patch("time.sleep")
+    batch_tiles_mock, sleep_mock = _mock_batch_tiles(tiles_sequence, mocker)
     logging_mock = mocker.patch("logging.Logger.info")
 
-    results = monitor_batch_job("mocked-request", config=config, sleep_time=sleep_time)
+    progress_bars: List[tqdm] = []
+
+    def _mocked_tqdm(*args: Any, **kwargs: Any) -> tqdm:
+        progress_bars.append(tqdm(*args, file=io.StringIO(), **kwargs))
+        return progress_bars[-1]
+
+    mocker.patch("sentinelhub.api.batch.utils.tqdm", side_effect=_mocked_tqdm)
+
+    results = monitor_batch_job("mocked-request", config=config, sleep_time=sleep_time, max_sleep_time=sleep_time)
 
     assert isinstance(results, defaultdict)
     assert set(results) == {BatchTileStatus.PROCESSED, BatchTileStatus.FAILED}
+
+    final_success_count = tile_status_sequence[-1].get(BatchTileStatus.PROCESSED, 0)
+    progress_bar, success_bar = progress_bars
+    assert progress_bar.n == tile_count
+    assert (success_bar.n, success_bar.total) == (final_success_count, tile_count)
     assert sum(len(tiles) for tiles in results.values()) == tile_count
     for tile_status in [BatchTileStatus.PROCESSED, BatchTileStatus.FAILED]:
         assert len(results[tile_status]) == tile_status_sequence[-1].get(tile_status, 0)
@@ -90,8 +110,13 @@ def test_monitor_batch_process_job(
 
     progress_loop_counts = len(tile_status_sequence) - 1
 
-    assert batch_tiles_mock.call_count == progress_loop_counts + 1
-    assert all(call.args == (batch_request,) and call.kwargs == {} for call in batch_tiles_mock.mock_calls)
+    finished_statuses = [BatchTileStatus.PROCESSED, BatchTileStatus.FAILED]
+    unfinished_statuses = [status for status in BatchTileStatus if status not in finished_statuses]
+    assert batch_tiles_mock.call_count == len(finished_statuses) * (progress_loop_counts + 1) + len(unfinished_statuses)
+    assert all(call.args == (batch_request,) for call in batch_tiles_mock.mock_calls)
+    assert [call.kwargs for call in batch_tiles_mock.mock_calls] == [
+        {"status": status} for status in finished_statuses
+    ] * (progress_loop_counts + 1) + [{"status": status} for status in unfinished_statuses]
 
     assert sleep_mock.call_count == progress_loop_counts
     assert all(call.args == (sleep_time,) and call.kwargs == {} for call in sleep_mock.mock_calls)
@@ -101,6 +126,120 @@ def test_monitor_batch_process_job(
     assert logging_mock.call_count == int(is_processing_logged) + int(is_failure_logged)
 
 
+@pytest.mark.skipif(sys.version < "3.8", reason="Mocking check for call.args doesn't work correctly for Python 3.7")
+@pytest.mark.parametrize(
+    "sleep_time, max_sleep_time, expected_sleep_times",
+    [
+        (60, None, [60, 90, 135, 60]),
+        (60, 100, [60, 90, 100, 60]),
+        (1000, None, [1000, 1000, 1000, 1000]),
+    ],
+)
+def test_monitor_batch_job_adaptive_sleep(
+    sleep_time: int, max_sleep_time: Optional[int], expected_sleep_times: List[float], mocker: MockerFixture
+) -> None:
+    """Sleeping time should back off while no tiles finish and shrink again once the job makes progress."""
+    tile_status_sequence = (
+        {BatchTileStatus.PENDING: 100},
+        {BatchTileStatus.PENDING: 100},
+        {BatchTileStatus.PENDING: 100},
+        {BatchTileStatus.PROCESSED: 50, BatchTileStatus.PENDING: 50},
+        {BatchTileStatus.PROCESSED: 100},
+    )
+    tiles_sequence = [_tile_status_counts_to_tiles(tile_status_counts) for tile_status_counts in tile_status_sequence]
+
+    batch_request = BatchRequest(
+        request_id="mocked-request", process_request={}, tile_count=100, status=BatchRequestStatus.PROCESSING
+    )
+    mocker.patch("sentinelhub.api.batch.utils.monitor_batch_analysis").return_value = batch_request
+    _, sleep_mock = _mock_batch_tiles(tiles_sequence, mocker)
+
+    results = monitor_batch_job("mocked-request", sleep_time=sleep_time, max_sleep_time=max_sleep_time)
+
+    assert len(results[BatchTileStatus.PROCESSED]) == 100
+    assert [call.args[0] for call in sleep_mock.mock_calls] == pytest.approx(expected_sleep_times)
+
+
+def _mock_batch_tiles(tiles_sequence: List[List[Dict[str, str]]], mocker: MockerFixture) -> Tuple[Mock, Mock]:
+    """Mocks sleeping and requesting info about batch tiles. Each call of sleep moves the mocked job one step forward
+    in the sequence of tiles.
+    """
+    sleep_mock = mocker.patch("time.sleep")
+
+    def _mocked_iter_tiles(_: BatchRequest, status: BatchTileStatus) -> List[Dict[str, str]]:
+        tiles = tiles_sequence[sleep_mock.call_count]
+        return [tile for tile in tiles if tile["status"] == status.value]
+
+    batch_tiles_mock = mocker.patch("sentinelhub.SentinelHubBatch.iter_tiles")
+    batch_tiles_mock.side_effect = _mocked_iter_tiles
+    return batch_tiles_mock, sleep_mock
+
+
+@pytest.mark.skipif(sys.version < "3.8", reason="Mocking check for call.args doesn't work correctly for Python 3.7")
+def test_monitor_batch_job_async(mocker: MockerFixture) -> None:
+    monitor_mock = mocker.patch("sentinelhub.api.batch.utils.monitor_batch_job")
+    monitor_mock.return_value = {BatchTileStatus.PROCESSED: [{"status": "PROCESSED"}]}
+
+    future = monitor_batch_job_async("mocked-request", sleep_time=100, max_sleep_time=200)
+
+    assert future.result(timeout=10) is monitor_mock.return_value
+    assert monitor_mock.call_count == 1
+    assert monitor_mock.mock_calls[0].args == ("mocked-request",)
+    assert monitor_mock.mock_calls[0].kwargs == {
+        "config": None,
+        "sleep_time": 100,
+        "analysis_sleep_time": 10,
+        "max_sleep_time": 200,
+    }
+
+
+def test_monitor_batch_job_async_error(mocker: MockerFixture) -> None:
+    monitor_mock = mocker.patch("sentinelhub.api.batch.utils.monitor_batch_job")
+    monitor_mock.side_effect = RuntimeError("Batch job failed")
+
+    future = monitor_batch_job_async("mocked-request")
+
+    with pytest.raises(RuntimeError, match="Batch job failed"):
+        future.result(timeout=10)
+    assert monitor_mock.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "sleep_time, finished_delta, remaining_count, expected_sleep_time",
+    [
+        (60, 0, 100, 90),
+        (500, 0, 100, 600),
+        (600, 0, 100, 600),
+        (120, 10, 1000, 600),
+        (120, 10, 200, 120),
+        (300, 10, 20, 60),
+        (300, 50, 0, 60),
+    ],
+)
+def test_get_next_sleep_time(
+    sleep_time: float, finished_delta: int, remaining_count: int, expected_sleep_time: float
+) -> None:
+    next_sleep_time = _get_next_sleep_time(
+        sleep_time,
+        finished_delta=finished_delta,
+        remaining_count=remaining_count,
+        min_sleep_time=60,
+        max_sleep_time=600,
+    )
+    assert next_sleep_time == pytest.approx(expected_sleep_time)
+
+
+def test_monitor_batch_process_job_unknown_tile_status(mocker: MockerFixture) -> None:
+    batch_request = BatchRequest(
+        request_id="mocked-request", process_request={}, tile_count=1, status=BatchRequestStatus.PROCESSING
+    )
+    mocker.patch("sentinelhub.api.batch.utils.monitor_batch_analysis").return_value = batch_request
+    mocker.patch("sentinelhub.SentinelHubBatch.iter_tiles").return_value = [{"status": "UNKNOWN"}]
+
+    with pytest.raises(ValueError):
+        monitor_batch_job("mocked-request")
+
+
 def _tile_status_counts_to_tiles(tile_status_counts: Dict[BatchTileStatus, int]) -> List[Dict[str, str]]:
     """From the info about how many tiles should have certain status it generates a list of tile payloads with these
     statuses.
@@ -181,6 +320,14 @@ def test_monitor_batch_job_sleep_time_error(monitor_function: Callable, sleep_ti
         monitor_function("x", analysis_sleep_time=4)
 
 
+def test_monitor_batch_job_max_sleep_time_error() -> None:
+    with pytest.raises(ValueError):
+        monitor_batch_job("x", sleep_time=120, max_sleep_time=60)
+
+    with pytest.raises(ValueError):
+        monitor_batch_job("x", sleep_time=1000, max_sleep_time=600)
+
+
 @pytest.mark.skipif(sys.version < "3.8", reason="Mocking check for call.args doesn't work correctly for Python 3.7")
 @pytest.mark.parametrize(
     "status_sequence",
@@ -49,6 +49,29 @@ def test_client_headers(request_type: RequestType, session: SentinelHubSession,
     assert mocked_request.headers["User-Agent"] == f"sentinelhub-py/v{__version__}"
 
 
+def test_http_session_is_shared() -> None:
+    """Makes sure all clients reuse the same HTTP connection pool."""
+    blank_config = SHConfig(use_defaults=True)
+    http_session = SentinelHubDownloadClient(config=blank_config)._get_http_session()
+
+    assert http_session is SentinelHubDownloadClient(config=blank_config)._get_http_session()
+    assert http_session is SentinelHubStatisticalDownloadClient(config=blank_config)._get_http_session()
+
+
+def test_http_session_does_not_keep_cookies(requests_mock: Mocker) -> None:
+    """Makes sure cookies set by one response are not sent with subsequent requests of any client."""
+    blank_config = SHConfig(use_defaults=True)
+    fake_url = "https://xyz.sentinel-hub.com/fake-endpoint"
+    requests_mock.get(url="/fake-endpoint", json={}, headers={"Set-Cookie": "leaked=secret; Path=/"})
+
+    SentinelHubDownloadClient(config=blank_config).get_json(fake_url)
+    SentinelHubStatisticalDownloadClient(config=blank_config).get_json(fake_url)
+
+    assert len(requests_mock.request_history) == 2
+    assert all("Cookie" not in request.headers for request in requests_mock.request_history)
+    assert len(SentinelHubDownloadClient._get_http_session().cookies) == 0
+
+
 @pytest.mark.sh_integration
 @pytest.mark.parametrize("client_object", [SentinelHubDownloadClient, SentinelHubDownloadClient()])
 def test_session_caching_and_clearing(client_object, session):